@@ -55,9 +55,7 @@ class AgileThinker(BaseAgent):
 
         prompt = prompt_gen["reactive"]
         if self.plan is not None:
-            lines = self.plan.split("\n")
-            for line in lines:
-                prompt += f"> {line.strip()}\n"
+            prompt += "".join(f"> {line.strip()}\n" for line in self.plan.split("\n"))
         messages = [{"role": "user", "content": prompt}]
         text, token_num = self.reactive_inference(messages, self.internal_budget)
         self.action = re.sub(
@@ -19,6 +19,8 @@ try:
 except ImportError:
     pass  # dotenv not installed, will use system environment variables only
 
+_BRACE_PATTERN = re.compile(r"[{}]")
+
 
 class BaseAgent:
     def __init__(
@@ -434,13 +436,13 @@ def extract_boxed(text: str, default_value: str = "") -> str:
             return matches[-1].strip()
         return default_value
     start_index += len(pattern) - 1
-    stack = []
-    for i in range(start_index, len(text)):
-        if text[i] == "{":
-            stack.append("{")
-        elif text[i] == "}":
-            if stack:
-                stack.pop()
-            if not stack:
-                return text[start_index + 1 : i].strip()
+    # Jump between braces rather than stepping through every character.
+    depth = 0
+    for match in _BRACE_PATTERN.finditer(text, start_index):
+        if match.group() == "{":
+            depth += 1
+        elif depth:
+            depth -= 1
+        if not depth:
+            return text[start_index + 1 : match.start()].strip()
     return default_value if default_value else text[start_index + 1 :].strip()
@@ -63,6 +63,17 @@ def _load_prompt_module(specifier: str) -> ModuleType:
         )
 
 
+def _capture_frame(surface: pygame.Surface) -> Image.Image:
+    """Convert a rendered surface into the image stored for the trajectory GIF.
+
+    Frames are quantized to palette mode here, as the GIF encoder would do on
+    save, so each buffered frame takes one byte per pixel and saving does not
+    stall on converting the whole trajectory at the end.
+    """
+    image = Image.fromarray(pygame.surfarray.array3d(surface).swapaxes(0, 1))
+    return image.convert("P", palette=Image.Palette.ADAPTIVE)
+
+
 def check_args(args: argparse.Namespace) -> None:
     if args.mode == "planning":
         assert args.internal_budget == 0, (
@@ -144,12 +155,12 @@ def game_loop(file: str, raw_seed: int, args: argparse.Namespace) -> dict[str, A
             )
             agent.resume_from_checkpoint(env, checkpoint_file)
     start_time = time.time()
-    surfaces = []
+    frames = []
 
     # New API loop: obs, done = env.reset()
     obs, done = env.reset()
     if render is not None:
-        surfaces.append(render.render(env))
+        frames.append(_capture_frame(render.render(env)))
     while not done:
         agent.observe(obs)
         agent.think(timeout=args.time_pressure)
@@ -158,17 +169,13 @@ def game_loop(file: str, raw_seed: int, args: argparse.Namespace) -> dict[str, A
         env.summary()
         agent.log(reward, reset_flag)
         if render is not None:
-            surfaces.append(render.render(env))
+            frames.append(_capture_frame(render.render(env)))
     if render is not None:
         gif_path = file.replace(".csv", ".gif")
-        images = [pygame.surfarray.array3d(surface) for surface in surfaces]
-        pil_images = [
-            Image.fromarray(images[i].swapaxes(0, 1)) for i in range(len(images))
-        ]
-        pil_images[0].save(
+        frames[0].save(
             gif_path,
             save_all=True,
-            append_images=pil_images[1:],
+            append_images=frames[1:],
             duration=1000,
             loop=0,
         )
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -155,14 +156,17 @@ class FreewayEnv(BaseEnv):
 
     def state_string(self) -> str:
         grid_string = ""
+        # Bucket moving cars by lane once instead of rescanning all cars per cell.
+        lane_cars = [[] for _ in range(10)]
+        for car in self.cars:
+            if car[3] is not None:
+                lane_cars[car[1]].append(car)
         for i in range(10):  # rows, i.e. y
             for j in range(9):  # columns, i.e. x
                 grid_string_add = ""
                 if j == 4 and self.pos == i:
                     grid_string_add += "P"
-                for car in self.cars:
-                    if car[3] is None or car[1] != i:
-                        continue
+                for car in lane_cars[i]:
                     dir = 1 if car[3] > 0 else -1
                     if car[0] == j:
                         speed = abs(car[3])
@@ -208,7 +212,7 @@ class FreewayEnv(BaseEnv):
                 pass
             assert car[2] < abs(car[3])
             car_states.append((9 - car[1], pos, dir, speed, car[4] * 12 - 1))
-        car_states.sort(key=lambda x: x[0])
+        car_states.sort(key=itemgetter(0))
         assert self.pos > 0
         state = {
             "player_states": player_states,
@@ -6,6 +6,7 @@
 
 import argparse
 import os
+from collections import deque
 from pathlib import Path
 from typing import Any, Optional
 
@@ -34,6 +35,14 @@ orientation_to_char_mapping = {
     (-1, 0): "L",  # Left
     (1, 0): "R",  # Right
 }
+# The rendered grid is flipped vertically, so "U" moves towards SOUTH in MDP coordinates.
+char_to_action_mapping = {
+    "U": Direction.SOUTH,
+    "D": Direction.NORTH,
+    "L": Direction.WEST,
+    "R": Direction.EAST,
+    "I": Action.INTERACT,
+}
 
 
 def parse_args(args: list, parser: argparse.ArgumentParser) -> argparse.Namespace:
@@ -140,10 +149,8 @@ class OvercookedEnv(BaseEnv):
         self.reward = 0
         self.game_turn = 0
         self.terminal = False
-        self.history = [
-            [],
-            [],
-        ]  # history[0] for player 0, history[1] for player 1
+        # history[0] for player 0, history[1] for player 1; only the last 5 actions are reported
+        self.history = [deque(maxlen=5), deque(maxlen=5)]
 
         # self.eval_env_infos = defaultdict(list)
         # Return initial observation and done flag
@@ -152,18 +159,7 @@ class OvercookedEnv(BaseEnv):
     def go(self, a: str) -> tuple[dict[str, Any], bool, float]:
         self.game_turn += 1
 
-        if a == "U":
-            action = Direction.SOUTH
-        elif a == "D":
-            action = Direction.NORTH
-        elif a == "L":
-            action = Direction.WEST
-        elif a == "R":
-            action = Direction.EAST
-        elif a == "I":
-            action = Action.INTERACT
-        else:
-            action = Action.STAY
+        action = char_to_action_mapping.get(a, Action.STAY)
         if self.gym_env.script_agent[0] is not None and hasattr(
             self.gym_env.script_agent[0], "next_action"
         ):
@@ -215,9 +211,7 @@ class OvercookedEnv(BaseEnv):
         all_order_info = self.gym_env.base_env.state.all_order_info()
         terrain = self.gym_env.base_mdp.terrain_pos_dict
         state = {
-            "history": self.history
-            if len(self.history[0]) <= 5
-            else [self.history[0][-5:], self.history[1][-5:]],
+            "history": [list(self.history[0]), list(self.history[1])],
             "game_turn": self.game_turn,
             "state": state,
             "all_orders": all_order_info,
@@ -5,15 +5,28 @@ import pygame
 
 
 class FreewayRender:
+    # Scaled sprites keyed by cell size, shared by every renderer in the process.
+    sprite_cache: dict[int, dict[str, pygame.Surface]] = {}
+
     def __init__(self, cell_size: int = 60) -> None:
         pygame.init()
         self.cell_size = cell_size
         self.width = 9 * cell_size  # 9 columns
         self.height = 10 * cell_size  # 10 rows
         self.assets_path = os.path.join(os.path.dirname(__file__), "assets", "freeway")
-        self.sprites = {}
-        self.load_sprites()
+        if cell_size in FreewayRender.sprite_cache:
+            self.sprites = FreewayRender.sprite_cache[cell_size]
+        else:
+            self.sprites = {}
+            self.load_sprites()
+            FreewayRender.sprite_cache[cell_size] = self.sprites
+        self.background = self.build_background()
         self.font = pygame.font.Font(None, 36)
+        self.end_font = pygame.font.Font(None, 48)
+        # Translucent end-of-game overlay, built once and reused for terminal frames.
+        self.overlay = pygame.Surface((self.width, self.height))
+        self.overlay.set_alpha(128)
+        self.overlay.fill((0, 0, 0))
 
     def load_sprites(self) -> None:
         sprite_files = {
@@ -43,12 +56,18 @@ class FreewayRender:
                         sprite, (self.cell_size * 0.95, self.cell_size * 0.95)
                     )
                 self.sprites[name] = sprite
+                if name.startswith("car_"):
+                    # Left-moving cars face the other way; flip once here, not per frame.
+                    self.sprites[f"{name}_left"] = pygame.transform.flip(
+                        sprite, True, False
+                    )
             else:
                 raise FileNotFoundError(
                     f"Sprite file {filename} not found in {self.assets_path}."
                 )
 
-    def render(self, env: Any) -> pygame.Surface:  # noqa: ANN401
+    def build_background(self) -> pygame.Surface:
+        # The road layout never changes, so it is drawn once and copied per frame.
         surface = pygame.Surface((self.width, self.height))
         surface.fill((255, 255, 255))
         for i in range(10):  # rows
@@ -70,6 +89,12 @@ class FreewayRender:
                             (line_x, (i + 1) * self.cell_size),
                             1,
                         )
+        return surface
+
+    def render(self, env: Any) -> pygame.Surface:  # noqa: ANN401
+        surface = self.background.copy()
+        # Collect sprite draws and composite them in one blits() call.
+        blits = []
         for car in env.cars:
             x, y, timer, speed, length = car
             if x is None or speed is None:
@@ -85,14 +110,15 @@ class FreewayRender:
 
             if car_x + length * self.cell_size > 0 and car_x < self.width:
                 sprite = self.get_vehicle_sprite(length, is_right)
-                surface.blit(sprite, (car_x, car_y))
+                blits.append((sprite, (car_x, car_y)))
 
         player_x = 4 * self.cell_size
         player_y = env.pos * self.cell_size
         target_x = player_x
         target_y = 0
-        surface.blit(self.sprites["target"], (target_x, target_y))
-        surface.blit(self.sprites["chicken"], (player_x, player_y))
+        blits.append((self.sprites["target"], (target_x, target_y)))
+        blits.append((self.sprites["chicken"], (player_x, player_y)))
+        surface.blits(blits, doreturn=False)
         self.draw_game_info(surface, env)
 
         return surface
@@ -100,13 +126,10 @@ class FreewayRender:
     def get_vehicle_sprite(
         self, vehicle_length: int, is_right_direction: bool
     ) -> pygame.Surface:
-        sprite_name = f"car_{vehicle_length}"
-        base_sprite = self.sprites[sprite_name]
-
         if is_right_direction:
-            return base_sprite
+            return self.sprites[f"car_{vehicle_length}"]
         else:
-            return pygame.transform.flip(base_sprite, True, False)
+            return self.sprites[f"car_{vehicle_length}_left"]
 
     def draw_game_info(self, surface: pygame.Surface, env: Any) -> None:  # noqa: ANN401
         info_text = f"Turn: {env.game_turn}"
@@ -126,12 +149,9 @@ class FreewayRender:
                 end_text = "GAME OVER"
                 color = (255, 0, 0)
 
-            end_surface = pygame.font.Font(None, 48).render(end_text, True, color)
+            end_surface = self.end_font.render(end_text, True, color)
             end_rect = end_surface.get_rect()
             end_rect.center = (self.width // 2, self.height // 2)
 
-            overlay = pygame.Surface((self.width, self.height))
-            overlay.set_alpha(128)
-            overlay.fill((0, 0, 0))
-            surface.blit(overlay, (0, 0))
+            surface.blit(self.overlay, (0, 0))
             surface.blit(end_surface, end_rect)
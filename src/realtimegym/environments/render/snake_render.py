@@ -3,8 +3,33 @@ from typing import Any, Optional
 
 import pygame
 
+head_sprite_names = {
+    "R": "head_right",
+    "D": "head_down",
+    "L": "head_left",
+    "U": "head_up",
+}
+tail_sprite_names = {
+    (1, 0): "tail_right",
+    (-1, 0): "tail_left",
+    (0, 1): "tail_up",
+    (0, -1): "tail_down",
+}
+# Keyed by the sorted (from, to) directions of a body segment.
+turn_sprite_names = {
+    ((-1, 0), (0, 1)): "turn_up_left",
+    ((0, 1), (1, 0)): "turn_up_right",
+    ((0, -1), (1, 0)): "turn_down_right",
+    ((-1, 0), (0, -1)): "turn_down_left",
+}
+
 
 class SnakeRender:
+    # Scaled (sprites, snake_sprites) keyed by cell size, shared by every renderer in the process.
+    sprite_cache: dict[
+        int, tuple[dict[str, pygame.Surface], dict[str, pygame.Surface]]
+    ] = {}
+
     def __init__(self, cell_size: int = 60) -> None:
         pygame.init()
         self.cell_size = cell_size
@@ -12,10 +37,21 @@ class SnakeRender:
         self.width = 8 * cell_size
         self.height = 8 * cell_size
 
-        self.sprites = {}
-        self.snake_sprites = {}
-        self.load_sprites()
+        if cell_size in SnakeRender.sprite_cache:
+            self.sprites, self.snake_sprites = SnakeRender.sprite_cache[cell_size]
+        else:
+            self.sprites = {}
+            self.snake_sprites = {}
+            self.load_sprites()
+            SnakeRender.sprite_cache[cell_size] = (self.sprites, self.snake_sprites)
+        self.background: Optional[pygame.Surface] = None
+        self.background_key: Optional[tuple[int, tuple]] = None
+        self.cell_pos: dict[tuple[int, int], tuple[int, int]] = {}
         self.font = pygame.font.Font(None, 36)
+        # Translucent end-of-game overlay, built once and reused for terminal frames.
+        self.overlay = pygame.Surface((self.width, self.height))
+        self.overlay.set_alpha(128)
+        self.overlay.fill((0, 0, 0))
 
     def load_sprites(self) -> None:
         sprite_files = {
@@ -134,17 +170,8 @@ class SnakeRender:
         elif from_dir[1] == 0 and to_dir[1] == 0:  # 水平
             return self.snake_sprites["straight_horizontal"]
 
-        dirs = sorted([from_dir, to_dir])
-        if dirs == [(-1, 0), (0, 1)]:
-            return self.snake_sprites["turn_up_left"]
-        elif dirs == [(0, 1), (1, 0)]:
-            return self.snake_sprites["turn_up_right"]
-        elif dirs == [(0, -1), (1, 0)]:
-            return self.snake_sprites["turn_down_right"]
-        elif dirs == [(-1, 0), (0, -1)]:
-            return self.snake_sprites["turn_down_left"]
-
-        return self.snake_sprites["straight_horizontal"]
+        dirs = (from_dir, to_dir) if from_dir <= to_dir else (to_dir, from_dir)
+        return self.snake_sprites[turn_sprite_names.get(dirs, "straight_horizontal")]
 
     def get_snake_tail_sprite(
         self, prev_pos: Optional[tuple[int, int]], curr_pos: tuple[int, int]
@@ -157,20 +184,22 @@ class SnakeRender:
 
         direction = (curr_x - prev_x, curr_y - prev_y)
 
-        direction_map = {
-            (1, 0): "tail_right",
-            (-1, 0): "tail_left",
-            (0, 1): "tail_up",
-            (0, -1): "tail_down",
-        }
-
         return self.snake_sprites.get(
-            direction_map.get(direction, "tail_left"),
+            tail_sprite_names.get(direction, "tail_left"),
             self.snake_sprites["tail_left"],
         )
 
-    def render(self, env: Any) -> pygame.Surface:  # noqa: ANN401
+    def get_background(self, env: Any) -> pygame.Surface:  # noqa: ANN401
+        # Board and obstacles are fixed within an episode, so they are drawn once.
+        key = (env.B, tuple(env.obstacle))
+        if self.background is not None and key == self.background_key:
+            return self.background
         size = env.B * self.cell_size
+        self.cell_pos = {
+            (x, y): (x * self.cell_size, (env.B - 1 - y) * self.cell_size)
+            for x in range(env.B)
+            for y in range(env.B)
+        }
         surface = pygame.Surface((size, size))
         surface.fill((0, 51, 51))
         for i in range(env.B):
@@ -189,45 +218,46 @@ class SnakeRender:
                     surface.fill((0, 102, 102), pos)
 
         for x, y in env.obstacle:
-            pos = (x * self.cell_size, (env.B - 1 - y) * self.cell_size)
+            pos = self.cell_pos[(x, y)]
             surface.blit(self.sprites["obstacle"], pos)
+        self.background = surface
+        self.background_key = key
+        return surface
+
+    def render(self, env: Any) -> pygame.Surface:  # noqa: ANN401
+        size = env.B * self.cell_size
+        surface = self.get_background(env).copy()
 
         for x, y in env.food:
-            pos = (x * self.cell_size, (env.B - 1 - y) * self.cell_size)
+            pos = self.cell_pos[(x, y)]
             if env.food_attributes[x][y][1] > 0:
                 surface.blit(self.sprites["apple"], pos)
                 life = env.food_attributes[x][y][0]
                 self.draw_life_bar(surface, life, 12, pos)
 
+        # Snake segments occupy distinct cells; composite them in one blits() call.
+        blits = []
         for i, (x, y) in enumerate(env.snake):
-            pos = (x * self.cell_size, (env.B - 1 - y) * self.cell_size)
+            pos = self.cell_pos[(x, y)]
             if i == len(env.snake) - 1:
-                direction_map = {
-                    "R": "right",
-                    "D": "down",
-                    "L": "left",
-                    "U": "up",
-                }
+                head_name = head_sprite_names.get(env.dir, "head_up")
                 if len(env.snake) == 1:
-                    head_sprite = self.sprites[
-                        f"head_{direction_map.get(env.dir, 'up')}"
-                    ]
+                    head_sprite = self.sprites[head_name]
                 else:
-                    head_sprite = self.snake_sprites[
-                        f"head_{direction_map.get(env.dir, 'up')}"
-                    ]
-                surface.blit(head_sprite, pos)
+                    head_sprite = self.snake_sprites[head_name]
+                blits.append((head_sprite, pos))
             elif i == 0:
                 prev_pos = env.snake[1] if len(env.snake) > 1 else None
                 tail_sprite = self.get_snake_tail_sprite(prev_pos, (x, y))
-                surface.blit(tail_sprite, pos)
+                blits.append((tail_sprite, pos))
             else:
                 prev_pos = env.snake[i + 1] if i < len(env.snake) - 1 else None
                 next_pos = env.snake[i - 1] if i > 0 else None
                 body_sprite = self.get_snake_body_sprite(
                     prev_pos, (x, y), next_pos, env.B
                 )
-                surface.blit(body_sprite, pos)
+                blits.append((body_sprite, pos))
+        surface.blits(blits, doreturn=False)
         self.draw_game_info(surface, env)
 
         crop_margin = self.cell_size // 4 * 3
@@ -292,8 +322,5 @@ class SnakeRender:
             end_rect = end_surface.get_rect()
             end_rect.center = (self.width // 2, self.height // 2)
 
-            overlay = pygame.Surface((self.width, self.height))
-            overlay.set_alpha(128)
-            overlay.fill((0, 0, 0))
-            surface.blit(overlay, (0, 0))
+            surface.blit(self.overlay, (0, 0))
             surface.blit(end_surface, end_rect)
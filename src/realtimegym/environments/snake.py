@@ -1,4 +1,4 @@
-from copy import deepcopy
+from collections import deque
 from typing import Any, Optional
 
 import numpy as np
@@ -6,6 +6,10 @@ import numpy as np
 from .base import BaseEnv
 from .render.snake_render import SnakeRender
 
+# Head movement for each direction, in board coordinates (y grows upwards).
+direction_delta = {"L": (-1, 0), "R": (1, 0), "D": (0, -1), "U": (0, 1)}
+opposite_direction = {"L": "R", "R": "L", "U": "D", "D": "U"}
+
 seed_mapping = {
     "E": {i: 1000 + i for i in range(32)},
     "M": {i: 5000 + i for i in range(32)},
@@ -32,7 +36,8 @@ class SnakeEnv(BaseEnv):
         self.coords = [
             (x, y) for x in range(1, self.B - 1) for y in range(1, self.B - 1)
         ]
-        self.snake = [(self.B // 2 - 1, self.B // 2 - 1)]
+        # Tail first, head last; a deque so the tail pops in O(1).
+        self.snake = deque([(self.B // 2 - 1, self.B // 2 - 1)])
         self.num_obstacle = self.seed // 1000
         step = self.num_obstacle
         self.obstacle = []
@@ -85,31 +90,20 @@ class SnakeEnv(BaseEnv):
     def step(self, a: str) -> tuple[dict[str, Any], bool, float, bool]:
         self.r = 0
         self.game_turn += 1
-        if (
-            (a == "L" and self.dir == "R")
-            or (a == "R" and self.dir == "L")
-            or (a == "U" and self.dir == "D")
-            or (a == "D" and self.dir == "U")
-        ):
+        if opposite_direction.get(a) == self.dir:
             a = self.dir  # prevent reverse direction
         #                raise ValueError(f"Invalid action a = {a}, dir = {self.dir}")
-        if a in ["L", "R", "U", "D"]:  # ignore invalid actions
+        if a in direction_delta:  # ignore invalid actions
             self.dir = a
-        head_x, head_y = self.snake[-1]
-        if self.dir == "L":
-            new_head = (head_x - 1, head_y)
-        elif self.dir == "R":
-            new_head = (head_x + 1, head_y)
-        elif self.dir == "D":
-            new_head = (head_x, head_y - 1)
-        elif self.dir == "U":
-            new_head = (head_x, head_y + 1)
-        else:
+        if self.dir not in direction_delta:
             raise ValueError(f"Invalid action a = {a}, dir = {self.dir}")
-        x, y = new_head
+        dx, dy = direction_delta[self.dir]
+        head_x, head_y = self.snake[-1]
+        x, y = head_x + dx, head_y + dy
+        new_head = (x, y)
         # Death trigger: hit body; hit wall; head hits newly grown tail
         if (
-            new_head in self.snake[1:]
+            (new_head in self.snake and new_head != self.snake[0])
             or new_head in self.obstacle
             or new_head[0] == 0
             or new_head[1] == 0
@@ -132,9 +126,9 @@ class SnakeEnv(BaseEnv):
             self.food.remove(new_head)
             self.food_attributes[x][y] = 0
             if self.r < 0:
-                self.snake.pop(0)
+                self.snake.popleft()
         else:
-            self.snake.pop(0)
+            self.snake.popleft()
 
         for food in self.food:
             x, y = food
@@ -151,18 +145,23 @@ class SnakeEnv(BaseEnv):
 
     def state_string(self) -> str:
         grid_string = ""
+        # Resolve occupancy once so each cell is a hash lookup, not a list scan.
+        obstacles = set(self.obstacle)
+        foods = set(self.food)
         snake_length = len(self.snake)
+        segments = {
+            pos: chr(ord("a") + snake_length - 1 - k)
+            for k, pos in enumerate(self.snake)
+        }
         for i in range(self.B):
             for j in range(self.B):
                 output = ""
                 x, y = j, self.B - 1 - i
-                if (x, y) in self.obstacle:
+                if (x, y) in obstacles:
                     output += "#"
-                if (x, y) in self.snake:
-                    output += chr(
-                        ord("a") + snake_length - 1 - self.snake.index((x, y))
-                    )
-                if (x, y) in self.food:
+                if (x, y) in segments:
+                    output += segments[(x, y)]
+                if (x, y) in foods:
                     if self.food_attributes[x][y][1] > 0:
                         output += "+"
                     else:
@@ -189,7 +188,7 @@ class SnakeEnv(BaseEnv):
         return actions
 
     def state_builder(self) -> dict[str, Any]:
-        snake = deepcopy(self.snake[::-1])
+        snake = list(reversed(self.snake))
         foods = []
         for x, y in self.food:
             lifespan, value = self.food_attributes[x][y]
@@ -21,6 +21,10 @@ ACTION_FORMAT_PROMPT = _TEMPLATES["action_format_prompt"]
 CONCLUSION_FORMAT_PROMPT = _TEMPLATES["conclusion_format_prompt"]
 FAST_AGENT_PROMPT = _TEMPLATES["fast_agent_prompt"]
 
+# Fixed instruction prefixes, concatenated once at import instead of every turn.
+_PLANNING_PREFIX = SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT
+_AGILE_PLANNING_PREFIX = SLOW_AGENT_PROMPT + CONCLUSION_FORMAT_PROMPT
+
 
 def state_to_description(
     state_for_llm: dict[str, Any], mode: Optional[str] = None
@@ -41,18 +45,18 @@ def state_to_description(
     description += """**Car State**:
 | Freeway \( k \) | Cars (head \( h \), tail \( \tau \), direction \( d \), speed \( s \)) |
 |-----------------|------------------------------------------------------------------------|\n"""
-    car_info = ""
+    rows = [description]
+    car_info = []
     lane = 1
     for car in state_for_llm["car_states"]:
         if car[0] != lane:
-            description += f"| {lane} | \({car_info}\) |\n"
-            car_info = ""
+            rows.append(f"| {lane} | \({', '.join(car_info)}\) |\n")
+            car_info = []
             lane = car[0]
         span = car[4] if car[2] == "left" else -car[4]
-        if car_info != "":
-            car_info += ", "
-        car_info += f"({car[1]}, {car[1] + span}, {car[2]}, {car[3]})"
-    description += f"| {lane} | \({car_info}\) |\n"
+        car_info.append(f"({car[1]}, {car[1] + span}, {car[2]}, {car[3]})")
+    rows.append(f"| {lane} | \({', '.join(car_info)}\) |\n")
+    description = "".join(rows)
 
     model1_description = (
         f"""**Current Turn:** \( t_0 = {game_turn} \) \n""" + description
@@ -64,12 +68,10 @@ def state_to_description(
     if mode == "reactive":
         return FAST_AGENT_PROMPT + model1_description
     elif mode == "planning":
-        return SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT + model2_description
+        return _PLANNING_PREFIX + model2_description
     elif mode == "agile":
         return {
-            "planning": SLOW_AGENT_PROMPT
-            + CONCLUSION_FORMAT_PROMPT
-            + model2_description,
+            "planning": _AGILE_PLANNING_PREFIX + model2_description,
             "reactive": FAST_AGENT_PROMPT + model1_description,
         }
     else:
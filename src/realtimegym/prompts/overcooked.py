@@ -1,6 +1,7 @@
 """Overcooked game prompts - Python logic for state-to-description conversion."""
 
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -28,6 +29,23 @@ CONCLUSION_FORMAT_PROMPT = _TEMPLATES["conclusion_format_prompt"]
 FAST_AGENT_PROMPT = _TEMPLATES["fast_agent_prompt"]
 GAME_STATE_PROMPT = _TEMPLATES["game_state_prompt"]
 
+# Fixed instruction prefixes, concatenated once at import instead of every turn.
+_PLANNING_PREFIX = SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT
+_AGILE_PLANNING_PREFIX = SLOW_AGENT_PROMPT + CONCLUSION_FORMAT_PROMPT
+
+
+@lru_cache(maxsize=32)
+def _describe_recipes(recipes: tuple[tuple[tuple[str, ...], int, int], ...]) -> str:
+    """Describe the order list; orders are fixed per layout, so this is cached."""
+    lines = []
+    for i, (ingredients, reward, time) in enumerate(recipes):
+        num_onions = ingredients.count(Recipe.ONION)
+        num_tomatoes = ingredients.count(Recipe.TOMATO)
+        lines.append(
+            f"Recipe {i + 1}: {num_onions} onions, {num_tomatoes} tomatoes; reward: {reward}; time to cook: {time} turns\n"
+        )
+    return "".join(lines)
+
 
 def state_to_description(
     state_for_llm: dict[str, Any], mode: Optional[str] = None
@@ -47,19 +65,12 @@ def state_to_description(
     plates = state_for_llm["layout"]["D"]
     pots = state_for_llm["layout"]["P"]
     serving_counters = state_for_llm["layout"]["S"]
-    recipe_infos = state_for_llm["all_orders"]
-    text_recipe_infos = ""
-    for i, recipe in enumerate(recipe_infos):
-        ingredients = recipe["ingredients"]
-        num_onions = len(
-            [ingredient for ingredient in ingredients if ingredient == Recipe.ONION]
+    text_recipe_infos = _describe_recipes(
+        tuple(
+            (tuple(recipe["ingredients"]), recipe["value"], recipe["time"])
+            for recipe in state_for_llm["all_orders"]
         )
-        num_tomatoes = len(
-            [ingredient for ingredient in ingredients if ingredient == Recipe.TOMATO]
-        )
-        reward = recipe["value"]
-        time = recipe["time"]
-        text_recipe_infos += f"Recipe {i + 1}: {num_onions} onions, {num_tomatoes} tomatoes; reward: {reward}; time to cook: {time} turns\n"
+    )
 
     position = [0, 0]
     orientation = [0, 0]
@@ -101,12 +112,8 @@ def state_to_description(
             sum([ingredient["position"] != pot_id for ingredient in ingredients]) == 0
         ), f"No ingredients found in pot {pot_id}."
         ingredients = [ingredient["name"] for ingredient in ingredients]
-        num_onions = len(
-            [ingredient for ingredient in ingredients if ingredient == Recipe.ONION]
-        )
-        num_tomatoes = len(
-            [ingredient for ingredient in ingredients if ingredient == Recipe.TOMATO]
-        )
+        num_onions = ingredients.count(Recipe.ONION)
+        num_tomatoes = ingredients.count(Recipe.TOMATO)
         if len(ingredients) == 0:
             ingredients_str = "nothing"
         else:
@@ -127,7 +134,8 @@ def state_to_description(
         text_pot_state = "All pots are empty."
     game_turn = state_for_llm["game_turn"]
 
-    model1_description = GAME_STATE_PROMPT.format(
+    # Both agents see the same state; only the turn label differs.
+    fields = dict(
         kitchen_counter=kitchen_counters,
         tomato=tomatoes if len(tomatoes) > 0 else "No tomato dispensers",
         onion=onions,
@@ -135,7 +143,6 @@ def state_to_description(
         pot=pots,
         serving_counter=serving_counters,
         recipe_infos=text_recipe_infos,
-        t_format=f"t_0 = {game_turn}",
         my_position=position[0],
         my_orientation=orientation[0],
         my_holding=held_object[0],
@@ -147,36 +154,20 @@ def state_to_description(
         kitchen_counter_state=text_kitchen_counter_state,
         pot_state=text_pot_state,
     )
+    model1_description = GAME_STATE_PROMPT.format(
+        t_format=f"t_0 = {game_turn}", **fields
+    )
     model2_description = GAME_STATE_PROMPT.format(
-        kitchen_counter=kitchen_counters,
-        tomato=tomatoes if len(tomatoes) > 0 else "No tomato dispensers",
-        onion=onions,
-        plate=plates,
-        pot=pots,
-        serving_counter=serving_counters,
-        recipe_infos=text_recipe_infos,
-        t_format=f"t_1 = {game_turn}",
-        my_position=position[0],
-        my_orientation=orientation[0],
-        my_holding=held_object[0],
-        my_action_history=history[0],
-        he_position=position[1],
-        he_orientation=orientation[1],
-        he_holding=held_object[1],
-        he_action_history=history[1],
-        kitchen_counter_state=text_kitchen_counter_state,
-        pot_state=text_pot_state,
+        t_format=f"t_1 = {game_turn}", **fields
     )
 
     if mode == "reactive":
         return FAST_AGENT_PROMPT + model1_description
     elif mode == "planning":
-        return SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT + model2_description
+        return _PLANNING_PREFIX + model2_description
     elif mode == "agile":
         return {
-            "planning": SLOW_AGENT_PROMPT
-            + CONCLUSION_FORMAT_PROMPT
-            + model2_description,
+            "planning": _AGILE_PLANNING_PREFIX + model2_description,
             "reactive": FAST_AGENT_PROMPT + model1_description,
         }
     else:
@@ -21,6 +21,10 @@ ACTION_FORMAT_PROMPT = _TEMPLATES["action_format_prompt"]
 CONCLUSION_FORMAT_PROMPT = _TEMPLATES["conclusion_format_prompt"]
 FAST_AGENT_PROMPT = _TEMPLATES["fast_agent_prompt"]
 
+# Fixed instruction prefixes, concatenated once at import instead of every turn.
+_PLANNING_PREFIX = SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT
+_AGILE_PLANNING_PREFIX = SLOW_AGENT_PROMPT + CONCLUSION_FORMAT_PROMPT
+
 
 def state_to_description(
     state_for_llm: dict[str, Any], mode: Optional[str] = None
@@ -40,8 +44,10 @@ def state_to_description(
     description += f"\t - Internal Obstacles: {state_for_llm['internal_obstacles'] if len(state_for_llm['internal_obstacles']) > 0 else 'No internal obstacles'}\n"
     description += f"**Snake Positions**:{state_for_llm['snake']}\n**Snake Head Direction**: {state_for_llm['snake_dir']}\n"
     description += "**Food Positions, Life Span and Value**:\n"
-    for x, y, life_span, value in state_for_llm["foods"]:
-        description += f"\t- ({x}, {y}, {life_span}, {value})\n"
+    description += "".join(
+        f"\t- ({x}, {y}, {life_span}, {value})\n"
+        for x, y, life_span, value in state_for_llm["foods"]
+    )
 
     model1_description = f"**Current Turn**: \( t_0 = {game_turn} \)\n" + description
     model2_description = f"**Current Turn**: \( t_1 = {game_turn} \)\n" + description
@@ -49,12 +55,10 @@ def state_to_description(
     if mode == "reactive":
         return FAST_AGENT_PROMPT + model1_description
     elif mode == "planning":
-        return SLOW_AGENT_PROMPT + ACTION_FORMAT_PROMPT + model2_description
+        return _PLANNING_PREFIX + model2_description
     elif mode == "agile":
         return {
-            "planning": SLOW_AGENT_PROMPT
-            + CONCLUSION_FORMAT_PROMPT
-            + model2_description,
+            "planning": _AGILE_PLANNING_PREFIX + model2_description,
             "reactive": FAST_AGENT_PROMPT + model1_description,
         }
     else:
@@ -2,9 +2,11 @@
 
 from typing import Any
 
+import pygame
 import pytest
 
 import realtimegym
+from realtimegym.agile_eval import _capture_frame
 
 
 class TestEnvironmentRegistry:
@@ -192,3 +194,23 @@ class TestSeeding:
 
         assert "game_turn" in obs1 and "state_string" in obs1 and "state" in obs1
         assert "game_turn" in obs2 and "state_string" in obs2 and "state" in obs2
+
+
+class TestTrajectoryFrames:
+    """Test conversion of rendered frames for trajectory GIFs."""
+
+    def test_capture_frame_keeps_new_colors(self) -> None:
+        """Test that a color absent from earlier frames is stored exactly."""
+        surface = pygame.Surface((40, 40))
+        surface.fill((128, 128, 128))
+        surface.fill((0, 0, 255), pygame.Rect(0, 0, 10, 10))
+        first = _capture_frame(surface)
+        assert first.convert("RGB").getpixel((5, 5)) == (0, 0, 255)
+
+        surface.fill((255, 0, 0), pygame.Rect(20, 20, 10, 10))
+        second = _capture_frame(surface)
+        rgb = second.convert("RGB")
+        assert second.mode == "P"
+        assert rgb.getpixel((25, 25)) == (255, 0, 0)
+        assert rgb.getpixel((5, 5)) == (0, 0, 255)
+        assert rgb.getpixel((35, 5)) == (128, 128, 128)